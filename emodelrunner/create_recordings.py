@@ -46,12 +46,10 @@ def get_pairsim_recordings(
     postsyn_rec = ephys.recordings.CompRecording(
         name=postsyn_prot_name, location=soma_loc, variable="v"
     )
-    postsyn_recs = [postsyn_rec]
-
-    for syn_loc in syn_locs:
-        for synrec in synrecs:
-            postsyn_recs.append(
-                SynapseRecordingCustom(name=synrec, location=syn_loc, variable=synrec)
-            )
+    postsyn_recs = [postsyn_rec] + [
+        SynapseRecordingCustom(name=synrec, location=syn_loc, variable=synrec)
+        for syn_loc in syn_locs
+        for synrec in synrecs
+    ]
 
     return (presyn_recs, postsyn_recs)
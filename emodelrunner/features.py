@@ -14,6 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections.abc import Mapping
 import json
 import logging
 
@@ -22,6 +23,27 @@ from bluepyopt.ephys.efeatures import eFELFeature
 logger = logging.getLogger(__name__)
 
 
+def load_feature_definitions(features_path):
+    """Load the feature definitions.
+
+    Top-level keys starting with '__' (e.g. '__comment') are dropped.
+
+    Args:
+        features_path (str): path to features file
+
+    Returns:
+        dict: feature definitions
+    """
+    with open(features_path, "rb") as features_file:
+        feature_definitions = {
+            key: value
+            for key, value in json.loads(features_file.read()).items()
+            if not key.startswith("__")
+        }
+
+    return feature_definitions
+
+
 def get_feature(
     feature_config,
     main_protocol,
@@ -109,11 +131,7 @@ def define_efeatures(main_protocol, features_path, prefix=""):
     Returns:
         dict: efeatures
     """
-    with open(features_path, "r", encoding="utf-8") as features_file:
-        feature_definitions = json.load(features_file)
-
-    if "__comment" in feature_definitions:
-        del feature_definitions["__comment"]
+    feature_definitions = load_feature_definitions(features_path)
 
     efeatures = {}
 
@@ -130,3 +148,78 @@ def define_efeatures(main_protocol, features_path, prefix=""):
                 efeatures[feature_name] = feature
 
     return efeatures
+
+
+class LazyEFeatures(Mapping):
+    """Read-only mapping of efeatures, building each efeature on first access.
+
+    The features file is only read when a feature is first looked up,
+    and only the looked up features are turned into eFELFeature objects.
+
+    Attributes:
+        main_protocol (ephys.protocols.Protocol): Main Protocol containing all the protocols
+        features_path (str): path to features file
+        prefix (str): prefix used in naming responses, features, recordings, etc.
+    """
+
+    def __init__(self, main_protocol, features_path, prefix=""):
+        """Constructor.
+
+        Args:
+            main_protocol (ephys.protocols.Protocol): Main Protocol
+                containing all the protocols
+            features_path (str): path to features file
+            prefix (str): prefix used in naming responses, features, recordings, etc.
+        """
+        self.main_protocol = main_protocol
+        self.features_path = features_path
+        self.prefix = prefix
+        self._feature_args = None
+        self._efeatures = {}
+
+    def _load(self):
+        """Read the features file and index the feature configs by feature name."""
+        if self._feature_args is not None:
+            return
+
+        feature_definitions = load_feature_definitions(self.features_path)
+
+        self._feature_args = {}
+        for protocol_name, locations in feature_definitions.items():
+            for recording_name, feature_configs in locations.items():
+                for feature_config in feature_configs:
+                    feature_name = (
+                        f"{self.prefix}.{protocol_name}.{recording_name}."
+                        f"{feature_config['feature']}"
+                    )
+                    self._feature_args[feature_name] = (
+                        feature_config,
+                        protocol_name,
+                        recording_name,
+                    )
+
+    def __getitem__(self, feature_name):
+        """Return the efeature, building it if it has not been built yet."""
+        if feature_name not in self._efeatures:
+            self._load()
+            feature_config, protocol_name, recording_name = self._feature_args[
+                feature_name
+            ]
+            _, self._efeatures[feature_name] = get_feature(
+                feature_config,
+                self.main_protocol,
+                protocol_name,
+                recording_name,
+                self.prefix,
+            )
+        return self._efeatures[feature_name]
+
+    def __iter__(self):
+        """Iterate over the feature names."""
+        self._load()
+        return iter(self._feature_args)
+
+    def __len__(self):
+        """Return the number of features."""
+        self._load()
+        return len(self._feature_args)
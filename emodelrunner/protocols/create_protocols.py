@@ -27,7 +27,8 @@ from emodelrunner.protocols import synplas_protocols
 
 from emodelrunner.synapses.recordings import SynapseRecordingCustom
 from emodelrunner.stimuli import MultipleSteps
-from emodelrunner.features import define_efeatures
+from emodelrunner.features import LazyEFeatures
+from emodelrunner.locations import SOMA_LOC
 from emodelrunner.protocols.reader import ProtocolParser
 from emodelrunner.synapses.create_locations import get_syn_locs
 from emodelrunner.synapses.stimuli import (
@@ -45,6 +46,8 @@ class ProtocolBuilder:
         protocols (bluepyopt.ephys.protocols.SequenceProtocol): the protocols to apply to the cell
     """
 
+    __slots__ = ("protocols",)
+
     def __init__(self, protocols):
         """Constructor to be called by the classmethod overloads.
 
@@ -56,13 +59,11 @@ class ProtocolBuilder:
     @staticmethod
     def _get_syn_locs(add_synapses, cell):
         """Wraps get_syn_locs with exception raising."""
-        syn_locs = None
-        if add_synapses:
-            if cell is not None:
-                syn_locs = get_syn_locs(cell)
-            else:
-                raise RuntimeError("'None' value encountered in cell object.")
-        return syn_locs
+        if not add_synapses:
+            return None
+        if cell is None:
+            raise RuntimeError("'None' value encountered in cell object.")
+        return get_syn_locs(cell)
 
     @classmethod
     def using_sscx_protocols(cls, add_synapses, prot_args, cell=None):
@@ -229,18 +230,15 @@ def create_protocols_object(
         raise ValueError(f"unsupported package type: {package_type}")
 
     if "Main" in protocols_dict:
-        efeatures = define_efeatures(
+        efeatures = LazyEFeatures(
             protocols_dict["Main"],
             features_path,
             mtype,
         )
 
-        if package_type == PackageType.sscx:
-            set_sscx_main_protocol_efeatures(protocols_dict, efeatures, prefix=mtype)
-        elif package_type == PackageType.thalamus:
-            set_thalamus_main_protocol_efeatures(
-                protocols_dict, efeatures, prefix=mtype
-            )
+        _main_protocol_efeatures_setters[package_type](
+            protocols_dict, efeatures, prefix=mtype
+        )
 
         protocols = [protocols_dict["Main"]]
     else:
@@ -259,7 +257,7 @@ def set_sscx_main_protocol_efeatures(protocols_dict, efeatures, prefix):
         protocols_dict (dict): contains all protocols to be run
             If this function is called, should contain the MainProtocol
             and the associated protocols (RinHoldCurrent, ThresholdDetection)
-        efeatures (dict): contains the efeatures
+        efeatures (Mapping): contains the efeatures
         prefix (str): prefix used in naming responses, features, recordings, etc.
     """
     protocols_dict["Main"].rmp_efeature = efeatures[f"{prefix}.RMP.soma.v.voltage_base"]
@@ -272,12 +270,9 @@ def set_sscx_main_protocol_efeatures(protocols_dict, efeatures, prefix):
         "Main"
     ].rinhold_protocol.rin_protocol_template.step_amplitude
 
-    protocols_dict["RinHoldcurrent"].voltagebase_efeature = efeatures[
-        f"{prefix}.Rin.soma.v.voltage_base"
-    ]
-    protocols_dict["ThresholdDetection"].holding_voltage = efeatures[
-        f"{prefix}.Rin.soma.v.voltage_base"
-    ].exp_mean
+    voltagebase_efeature = efeatures[f"{prefix}.Rin.soma.v.voltage_base"]
+    protocols_dict["RinHoldcurrent"].voltagebase_efeature = voltagebase_efeature
+    protocols_dict["ThresholdDetection"].holding_voltage = voltagebase_efeature.exp_mean
 
 
 def set_thalamus_main_protocol_efeatures(protocols_dict, efeatures, prefix):
@@ -287,7 +282,7 @@ def set_thalamus_main_protocol_efeatures(protocols_dict, efeatures, prefix):
         protocols_dict (dict): contains all protocols to be run
             If this function is called, should contain the MainProtocol
             and the associated protocols (RinHoldCurrent, ThresholdDetection)
-        efeatures (dict): contains the efeatures
+        efeatures (Mapping): contains the efeatures
         prefix (str): prefix used in naming responses, features, recordings, etc.
     """
     protocols_dict["Main"].rmp_efeature = efeatures[
@@ -311,19 +306,25 @@ def set_thalamus_main_protocol_efeatures(protocols_dict, efeatures, prefix):
     ].rinhold_protocol_hyp.rin_protocol_template.step_stimulus.step_amplitude
 
     with contextlib.suppress(KeyError):
-        protocols_dict["RinHoldcurrent_dep"].voltagebase_efeature = efeatures[
-            f"{prefix}.Rin_dep.soma.v.voltage_base"
-        ]
-        protocols_dict["ThresholdDetection_dep"].holding_voltage = efeatures[
-            f"{prefix}.Rin_dep.soma.v.voltage_base"
-        ].exp_mean
+        voltagebase_efeature_dep = efeatures[f"{prefix}.Rin_dep.soma.v.voltage_base"]
+        protocols_dict["RinHoldcurrent_dep"].voltagebase_efeature = (
+            voltagebase_efeature_dep
+        )
+        protocols_dict["ThresholdDetection_dep"].holding_voltage = (
+            voltagebase_efeature_dep.exp_mean
+        )
+
+    voltagebase_efeature_hyp = efeatures[f"{prefix}.Rin_hyp.soma.v.voltage_base"]
+    protocols_dict["RinHoldcurrent_hyp"].voltagebase_efeature = voltagebase_efeature_hyp
+    protocols_dict["ThresholdDetection_hyp"].holding_voltage = (
+        voltagebase_efeature_hyp.exp_mean
+    )
 
-    protocols_dict["RinHoldcurrent_hyp"].voltagebase_efeature = efeatures[
-        f"{prefix}.Rin_hyp.soma.v.voltage_base"
-    ]
-    protocols_dict["ThresholdDetection_hyp"].holding_voltage = efeatures[
-        f"{prefix}.Rin_hyp.soma.v.voltage_base"
-    ].exp_mean
+
+_main_protocol_efeatures_setters = {
+    PackageType.sscx: set_sscx_main_protocol_efeatures,
+    PackageType.thalamus: set_thalamus_main_protocol_efeatures,
+}
 
 
 def define_synapse_plasticity_protocols(
@@ -360,20 +361,16 @@ def define_synapse_plasticity_protocols(
     )
 
     # recording location
-    soma_loc = ephys.locations.NrnSeclistCompLocation(
-        name="soma", seclist_name="somatic", sec_index=0, comp_x=0.5
-    )
+    soma_loc = SOMA_LOC
     # recording
     rec = ephys.recordings.CompRecording(
         name=protocol_name, location=soma_loc, variable="v"
     )
-    recs = [rec]
-
-    for syn_loc in syn_locs:
-        for synrec in synrecs:
-            recs.append(
-                SynapseRecordingCustom(name=synrec, location=syn_loc, variable=synrec)
-            )
+    recs = [rec] + [
+        SynapseRecordingCustom(name=synrec, location=syn_loc, variable=synrec)
+        for syn_loc in syn_locs
+        for synrec in synrecs
+    ]
 
     # pulses
     stims = load_pulses(soma_loc, stim_path)
@@ -417,9 +414,7 @@ def define_pairsim_protocols(
     """
     # pylint: disable=too-many-arguments, too-many-locals, too-many-positional-arguments
     # locations
-    soma_loc = ephys.locations.NrnSeclistCompLocation(
-        name="soma", seclist_name="somatic", sec_index=0, comp_x=0.5
-    )
+    soma_loc = SOMA_LOC
     syn_locs = get_syn_locs(postcell)
 
     # recordings
@@ -15,21 +15,33 @@
 # limitations under the License.
 
 import logging
+from types import MappingProxyType
 
 from bluepyopt import ephys
 
 from emodelrunner.recordings import RecordingCustom
 from emodelrunner.locations import SOMA_LOC
 
-
 logger = logging.getLogger(__name__)
 
-seclist_to_sec = {
-    "somatic": "soma",
-    "apical": "apic",
-    "axonal": "axon",
-    "myelinated": "myelin",
-}
+seclist_to_sec = MappingProxyType(
+    {
+        "somatic": "soma",
+        "apical": "apic",
+        "axonal": "axon",
+        "myelinated": "myelin",
+    }
+)
+
+# Those protocols cannot be used if they are not in MainProtocol
+forbidden_protocols = frozenset(
+    [
+        "RatSSCxRinHoldcurrentProtocol",
+        "RatSSCxThresholdDetectionProtocol",
+        "StepThresholdProtocol",
+        "RampThresholdProtocol",
+    ]
+)
 
 
 class CurrentOutputKeyMixin:
@@ -43,12 +55,62 @@ class CurrentOutputKeyMixin:
         """
         if self.recordings is not None:
             # this gives 'prefix.name'
-            name = ".".join(self.recordings[0].name.split(".")[:2])
+            name = ".".join(self.recordings[0].name.split(".", 2)[:2])
         else:
             name = ""
         return "current_" + name
 
 
+def _get_somadistance_location(recording_definition, apical_point_isec):
+    """Get the location of a 'somadistance' extra recording."""
+    # pylint: disable=unused-argument
+    return ephys.locations.NrnSomaDistanceCompLocation(
+        name=recording_definition["name"],
+        soma_distance=recording_definition["somadistance"],
+        seclist_name=recording_definition["seclist_name"],
+    )
+
+
+def _get_somadistanceapic_location(recording_definition, apical_point_isec):
+    """Get the location of a 'somadistanceapic' extra recording."""
+    if apical_point_isec == -1:
+        raise ValueError(
+            "Cannot record at a given distance from apical point"
+            f"if apical_point_isec is {apical_point_isec}."
+        )
+    sec_name = seclist_to_sec.get(recording_definition["seclist_name"])
+    if sec_name is None:
+        raise ValueError(
+            f"Section list {recording_definition['seclist_name']} not supported "
+            "for recordings at a given distance from apical point."
+        )
+    return ephys.locations.NrnSecSomaDistanceCompLocation(
+        name=recording_definition["name"],
+        soma_distance=recording_definition["somadistance"],
+        seclist_name=sec_name,
+        sec_index=apical_point_isec,
+    )
+
+
+def _get_nrnseclistcomp_location(recording_definition, apical_point_isec):
+    """Get the location of a 'nrnseclistcomp' extra recording."""
+    # pylint: disable=unused-argument
+    return ephys.locations.NrnSeclistCompLocation(
+        name=recording_definition["name"],
+        comp_x=recording_definition["comp_x"],
+        sec_index=recording_definition["sec_index"],
+        seclist_name=recording_definition["seclist_name"],
+    )
+
+
+# extra recording location getters by recording type
+_extra_recording_location_getters = {
+    "somadistance": _get_somadistance_location,
+    "somadistanceapic": _get_somadistanceapic_location,
+    "nrnseclistcomp": _get_nrnseclistcomp_location,
+}
+
+
 def get_extra_recording_location(recording_definition, apical_point_isec=-1):
     """Get the location for the extra recording.
 
@@ -60,44 +122,19 @@ def get_extra_recording_location(recording_definition, apical_point_isec=-1):
     Raises:
         ValueError: if the recording definition "type" is "somadistanceapic" and
             apical_point_isec is -1.
+        ValueError: if the recording definition "type" is "somadistanceapic" and
+            its "seclist_name" is not in seclist_to_sec.
         ValueError: if the 'type' in the recording definition is neither
             "somadistance", nor "somadistanceapic", nor "nrnseclistcomp"
 
     Returns:
         location of the extra recording
     """
-    if recording_definition["type"] == "somadistance":
-        location = ephys.locations.NrnSomaDistanceCompLocation(
-            name=recording_definition["name"],
-            soma_distance=recording_definition["somadistance"],
-            seclist_name=recording_definition["seclist_name"],
-        )
-
-    elif recording_definition["type"] == "somadistanceapic":
-        if apical_point_isec == -1:
-            raise ValueError(
-                "Cannot record at a given distance from apical point"
-                f"if apical_point_isec is {apical_point_isec}."
-            )
-        location = ephys.locations.NrnSecSomaDistanceCompLocation(
-            name=recording_definition["name"],
-            soma_distance=recording_definition["somadistance"],
-            seclist_name=seclist_to_sec[recording_definition["seclist_name"]],
-            sec_index=apical_point_isec,
-        )
-
-    elif recording_definition["type"] == "nrnseclistcomp":
-        location = ephys.locations.NrnSeclistCompLocation(
-            name=recording_definition["name"],
-            comp_x=recording_definition["comp_x"],
-            sec_index=recording_definition["sec_index"],
-            seclist_name=recording_definition["seclist_name"],
-        )
-
-    else:
+    get_location = _extra_recording_location_getters.get(recording_definition["type"])
+    if get_location is None:
         raise ValueError(f"Recording type {recording_definition['type']} not supported")
 
-    return location
+    return get_location(recording_definition, apical_point_isec)
 
 
 def get_recordings(protocol_name, protocol_definition, prefix, apical_point_isec=-1):
@@ -114,10 +151,12 @@ def get_recordings(protocol_name, protocol_definition, prefix, apical_point_isec
     Returns:
         list of RecordingCustom
     """
+    recording_prefix = f"{prefix}.{protocol_name}"
+
     recordings = []
     recordings.append(
         RecordingCustom(
-            name=f"{prefix}.{protocol_name}.soma.v",
+            name=f"{recording_prefix}.soma.v",
             location=SOMA_LOC,
             variable="v",
         )
@@ -131,7 +170,7 @@ def get_recordings(protocol_name, protocol_definition, prefix, apical_point_isec
 
             var = recording_definition["var"]
             recording = RecordingCustom(
-                name=f"{prefix}.{protocol_name}.{location.name}.{var}",
+                name=f"{recording_prefix}.{location.name}.{var}",
                 location=location,
                 variable=var,
             )
@@ -140,6 +179,36 @@ def get_recordings(protocol_name, protocol_definition, prefix, apical_point_isec
     return recordings
 
 
+def get_main_protocol_names(
+    protocol_definitions, chain_protocols, chain_protocol_types
+):
+    """Get the names of the protocols used by the Main protocol.
+
+    Args:
+        protocol_definitions (dict): contains all the protocol definitions,
+            including the Main protocol definition
+        chain_protocols (iterable of str): names of the protocols the Main protocol
+            is built from, on top of its 'other' and 'pre' protocols
+        chain_protocol_types (container of str): types of the protocols
+            the Main protocol is built from, whatever their names
+
+    Returns:
+        set of str: names of the protocols used by the Main protocol
+    """
+    main_definition = protocol_definitions["Main"]
+
+    protocol_names = set(chain_protocols)
+    protocol_names.update(
+        protocol_name
+        for protocol_name, protocol_definition in protocol_definitions.items()
+        if protocol_definition.get("type") in chain_protocol_types
+    )
+    protocol_names.update(main_definition["other_protocols"])
+    protocol_names.update(main_definition.get("pre_protocols", []))
+
+    return protocol_names
+
+
 def check_for_forbidden_protocol(protocols_dict):
     """Check for unsupported protocol.
 
@@ -150,17 +219,10 @@ def check_for_forbidden_protocol(protocols_dict):
         ValueError: If a protocol that should only be used with MainProtocol is present
             in protocols_dict
     """
-    # Those protocols cannot be used if they are not in MainProtocol
-    forbidden_prots = [
-        "RatSSCxRinHoldcurrentProtocol",
-        "RatSSCxThresholdDetectionProtocol",
-        "StepThresholdProtocol",
-        "RampThresholdProtocol",
-    ]
     # check the class name of each protocol
     for prot in protocols_dict.values():
-        if type(prot).__name__ in forbidden_prots:
-            prot_name = type(prot).__name__
+        prot_name = type(prot).__name__
+        if prot_name in forbidden_protocols:
             raise ValueError(
                 f"No MainProtocol found, but {prot_name} was found."
                 f"To use {prot_name}, please set MainProtocol."
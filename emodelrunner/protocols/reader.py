@@ -14,6 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import logging
 import json
 from bluepyopt import ephys
@@ -26,16 +27,45 @@ from emodelrunner.synapses.stimuli import (
 )
 from emodelrunner.protocols.protocols_func import (
     check_for_forbidden_protocol,
+    get_main_protocol_names,
     get_recordings,
 )
 
 
 logger = logging.getLogger(__name__)
 
+_vecstim_random_options = frozenset(("python", "neuron"))
+
+
+def _get_step_readers(protocol_module, stochkv_det):
+    """Return the step protocol readers by protocol type.
+
+    Args:
+        protocol_module (module): module that contains the protocols
+        stochkv_det (bool): set if stochastic or deterministic
+
+    Returns:
+        dict: readers taking the protocol name, definition and recordings as keywords
+    """
+    return {
+        "StepProtocol": functools.partial(
+            read_step_protocol,
+            protocol_module=protocol_module,
+            stochkv_det=stochkv_det,
+        ),
+        "StepThresholdProtocol": functools.partial(
+            read_step_threshold_protocol,
+            protocol_module=protocol_module,
+            stochkv_det=stochkv_det,
+        ),
+    }
+
 
 class ProtocolParser:
     """Parses the protocol json file."""
 
+    __slots__ = ("protocols_dict",)
+
     def __init__(self) -> None:
         """Constructor.
 
@@ -48,66 +78,49 @@ class ProtocolParser:
     def load_protocol_json(protocols_filepath):
         """Loads the protocol json file.
 
+        Top-level keys starting with '__' (e.g. '__comment') are dropped.
+
         Args:
             protocols_filepath (str or Path): path to the protocols file.
 
         Returns:
             dict: dict containing protocols json input.
         """
-        with open(protocols_filepath, "r", encoding="utf-8") as protocol_file:
-            protocol_definitions = json.load(protocol_file)
-
-        if "__comment" in protocol_definitions:
-            del protocol_definitions["__comment"]
+        with open(protocols_filepath, "rb") as protocol_file:
+            protocol_definitions = {
+                key: value
+                for key, value in json.loads(protocol_file.read()).items()
+                if not key.startswith("__")
+            }
 
         return protocol_definitions
 
-    def _parse_step_and_ramp(
-        self,
-        protocol_definition,
-        protocol_name,
-        protocol_module,
-        recordings,
-        stochkv_det,
-    ):
-        """Parses the step and ramp protocols into self.protocols_dict."""
-        if protocol_definition["type"] == "StepProtocol":
-            self.protocols_dict[protocol_name] = read_step_protocol(
-                protocol_name,
-                protocol_module,
-                protocol_definition,
-                recordings,
-                stochkv_det,
-            )
-        elif protocol_definition["type"] == "StepThresholdProtocol":
-            self.protocols_dict[protocol_name] = read_step_threshold_protocol(
-                protocol_name,
-                protocol_module,
-                protocol_definition,
-                recordings,
-                stochkv_det,
-            )
-        if protocol_module is sscx_protocols:
-            if protocol_definition["type"] == "RampThresholdProtocol":
-                self.protocols_dict[protocol_name] = read_ramp_threshold_protocol(
-                    protocol_name,
-                    protocol_definition,
-                    recordings,
-                )
-            elif protocol_definition["type"] == "RampProtocol":
-                self.protocols_dict[protocol_name] = read_ramp_protocol(
-                    protocol_name, protocol_definition, recordings
-                )
-
     def _parse_sscx_threshold_detection(self, protocol_definition, recordings, prefix):
         """Parses the sscx threshold detection protocol into self.protocols_dict."""
-        if protocol_definition["type"] == "RatSSCxThresholdDetectionProtocol":
-            self.protocols_dict["ThresholdDetection"] = (
-                sscx_protocols.RatSSCxThresholdDetectionProtocol(
-                    "IDRest",
+        self.protocols_dict["ThresholdDetection"] = (
+            sscx_protocols.RatSSCxThresholdDetectionProtocol(
+                "IDRest",
+                step_protocol_template=read_step_protocol(
+                    "Threshold",
+                    sscx_protocols,
+                    protocol_definition["step_template"],
+                    recordings,
+                ),
+                prefix=prefix,
+            )
+        )
+
+    def _parse_thalamus_threshold_detection(
+        self, protocol_name, protocol_definition, recordings, prefix
+    ):
+        """Parses the thalamus threshold detection protocol into self.protocols_dict."""
+        if protocol_name in ("ThresholdDetection_dep", "ThresholdDetection_hyp"):
+            self.protocols_dict[protocol_name] = (
+                thalamus_protocols.RatSSCxThresholdDetectionProtocol(
+                    protocol_name,
                     step_protocol_template=read_step_protocol(
-                        "Threshold",
-                        sscx_protocols,
+                        protocol_name,
+                        thalamus_protocols,
                         protocol_definition["step_template"],
                         recordings,
                     ),
@@ -115,78 +128,43 @@ class ProtocolParser:
                 )
             )
 
-    def _parse_thalamus_threshold_detection(
-        self, protocol_definition, protocol_name, recordings, prefix
-    ):
-        """Parses the thalamus threshold detection protocol into self.protocols_dict."""
-        if protocol_definition["type"] == "RatSSCxThresholdDetectionProtocol":
-            if protocol_name == "ThresholdDetection_dep":
-                self.protocols_dict["ThresholdDetection_dep"] = (
-                    thalamus_protocols.RatSSCxThresholdDetectionProtocol(
-                        "ThresholdDetection_dep",
-                        step_protocol_template=read_step_protocol(
-                            "ThresholdDetection_dep",
-                            thalamus_protocols,
-                            protocol_definition["step_template"],
-                            recordings,
-                        ),
-                        prefix=prefix,
-                    )
-                )
-            elif protocol_name == "ThresholdDetection_hyp":
-                self.protocols_dict["ThresholdDetection_hyp"] = (
-                    thalamus_protocols.RatSSCxThresholdDetectionProtocol(
-                        "ThresholdDetection_hyp",
-                        step_protocol_template=read_step_protocol(
-                            "ThresholdDetection_hyp",
-                            thalamus_protocols,
-                            protocol_definition["step_template"],
-                            recordings,
-                        ),
-                        prefix=prefix,
-                    )
-                )
-
-    def _parse_vecstim_netstim(
-        self, protocol_definition, protocol_name, recordings, syn_locs
-    ):
-        """Parses the vecstim netstim protocols into self.protocols_dict."""
-        if protocol_definition["type"] == "Vecstim":
-            self.protocols_dict[protocol_name] = read_vecstim_protocol(
-                protocol_name, protocol_definition, recordings, syn_locs
-            )
-        elif protocol_definition["type"] == "Netstim":
-            self.protocols_dict[protocol_name] = read_netstim_protocol(
-                protocol_name, protocol_definition, recordings, syn_locs
-            )
+    # protocols built from the Main protocol definition, not by the parse loops
+    _sscx_main_protocols = frozenset(("Main", "RinHoldcurrent"))
+    _thalamus_main_protocols = frozenset(
+        ("Main", "RinHoldcurrent_dep", "RinHoldcurrent_hyp")
+    )
+    # protocols the Main protocol is built from, by name and by type
+    _sscx_chain_protocols = frozenset(("RMP", "Rin"))
+    _thalamus_chain_protocols = frozenset(("RMP", "Rin_dep", "Rin_hyp"))
+    _chain_protocol_types = frozenset(("RatSSCxThresholdDetectionProtocol",))
 
     def _parse_sscx_main(self, protocol_definitions, prefix):
         """Parses the main sscx protocol into self.protocols_dict."""
+        main_definition = protocol_definitions["Main"]
+        rinhold_definition = protocol_definitions["RinHoldcurrent"]
+
         self.protocols_dict["RinHoldcurrent"] = (
             sscx_protocols.RatSSCxRinHoldcurrentProtocol(
                 "RinHoldCurrent",
                 rin_protocol_template=self.protocols_dict["Rin"],
-                holdi_precision=protocol_definitions["RinHoldcurrent"][
-                    "holdi_precision"
-                ],
-                holdi_max_depth=protocol_definitions["RinHoldcurrent"][
-                    "holdi_max_depth"
-                ],
+                holdi_precision=rinhold_definition["holdi_precision"],
+                holdi_max_depth=rinhold_definition["holdi_max_depth"],
                 prefix=prefix,
             )
         )
 
-        other_protocols = []
-
-        for protocol_name in protocol_definitions["Main"]["other_protocols"]:
-            if protocol_name in self.protocols_dict:
-                other_protocols.append(self.protocols_dict[protocol_name])
-
-        pre_protocols = []
+        other_protocols = [
+            protocol
+            for protocol in map(
+                self.protocols_dict.get, main_definition["other_protocols"]
+            )
+            if protocol is not None
+        ]
 
-        if "pre_protocols" in protocol_definitions["Main"]:
-            for protocol_name in protocol_definitions["Main"]["pre_protocols"]:
-                pre_protocols.append(self.protocols_dict[protocol_name])
+        pre_protocols = [
+            self.protocols_dict[protocol_name]
+            for protocol_name in main_definition.get("pre_protocols", [])
+        ]
 
         self.protocols_dict["Main"] = sscx_protocols.RatSSCxMainProtocol(
             "Main",
@@ -199,20 +177,19 @@ class ProtocolParser:
 
     def _parse_thalamus_main(self, protocol_definitions, prefix):
         """Parses the main thalamus protocol into self.protocols_dict."""
+        main_definition = protocol_definitions["Main"]
+
         try:  # Only low-threshold bursting cells have thin protocol
+            rinhold_definition_dep = protocol_definitions["RinHoldcurrent_dep"]
             self.protocols_dict["RinHoldcurrent_dep"] = (
                 thalamus_protocols.RatSSCxRinHoldcurrentProtocol(
                     "RinHoldcurrent_dep",
                     rin_protocol_template=self.protocols_dict["Rin_dep"],
-                    holdi_estimate_multiplier=protocol_definitions[
-                        "RinHoldcurrent_dep"
-                    ]["holdi_estimate_multiplier"],
-                    holdi_precision=protocol_definitions["RinHoldcurrent_dep"][
-                        "holdi_precision"
-                    ],
-                    holdi_max_depth=protocol_definitions["RinHoldcurrent_dep"][
-                        "holdi_max_depth"
+                    holdi_estimate_multiplier=rinhold_definition_dep[
+                        "holdi_estimate_multiplier"
                     ],
+                    holdi_precision=rinhold_definition_dep["holdi_precision"],
+                    holdi_max_depth=rinhold_definition_dep["holdi_max_depth"],
                     prefix=prefix,
                 )
             )
@@ -222,32 +199,29 @@ class ProtocolParser:
             rinhold_protocol_dep = None
             thdetect_protocol_dep = None
 
+        rinhold_definition_hyp = protocol_definitions["RinHoldcurrent_hyp"]
         self.protocols_dict["RinHoldcurrent_hyp"] = (
             thalamus_protocols.RatSSCxRinHoldcurrentProtocol(
                 "RinHoldcurrent_hyp",
                 rin_protocol_template=self.protocols_dict["Rin_hyp"],
-                holdi_estimate_multiplier=protocol_definitions["RinHoldcurrent_hyp"][
+                holdi_estimate_multiplier=rinhold_definition_hyp[
                     "holdi_estimate_multiplier"
                 ],
-                holdi_precision=protocol_definitions["RinHoldcurrent_hyp"][
-                    "holdi_precision"
-                ],
-                holdi_max_depth=protocol_definitions["RinHoldcurrent_hyp"][
-                    "holdi_max_depth"
-                ],
+                holdi_precision=rinhold_definition_hyp["holdi_precision"],
+                holdi_max_depth=rinhold_definition_hyp["holdi_max_depth"],
                 prefix=prefix,
             )
         )
 
         other_protocols = [
             self.protocols_dict[protocol_name]
-            for protocol_name in protocol_definitions["Main"]["other_protocols"]
+            for protocol_name in main_definition["other_protocols"]
         ]
 
-        pre_protocols = []
-        if "pre_protocols" in protocol_definitions["Main"]:
-            for protocol_name in protocol_definitions["Main"]["pre_protocols"]:
-                pre_protocols.append(self.protocols_dict[protocol_name])
+        pre_protocols = [
+            self.protocols_dict[protocol_name]
+            for protocol_name in main_definition.get("pre_protocols", [])
+        ]
 
         self.protocols_dict["Main"] = thalamus_protocols.RatSSCxMainProtocol(
             "Main",
@@ -281,48 +255,59 @@ class ProtocolParser:
                 locations of the synapses (if any, else None)
 
         Returns:
-            dict containing the protocols
+            dict containing the protocols.
+            If there is a Main protocol, only the Main protocol and the protocols
+            it is built from or runs are included. The other protocols are not parsed.
         """
         protocol_definitions = self.load_protocol_json(protocols_filepath)
 
+        if "Main" in protocol_definitions:
+            # only build the protocols that are used by the Main protocol
+            used_protocols = get_main_protocol_names(
+                protocol_definitions,
+                self._sscx_chain_protocols,
+                self._chain_protocol_types,
+            )
+        else:
+            used_protocols = protocol_definitions
+
+        # protocol readers by protocol type. Unknown types are ignored.
+        readers = _get_step_readers(sscx_protocols, stochkv_det)
+        readers.update(
+            {
+                "RampThresholdProtocol": read_ramp_threshold_protocol,
+                "RampProtocol": read_ramp_protocol,
+                "Vecstim": functools.partial(read_vecstim_protocol, syn_locs=syn_locs),
+                "Netstim": functools.partial(read_netstim_protocol, syn_locs=syn_locs),
+            }
+        )
+
         for protocol_name, protocol_definition in protocol_definitions.items():
-            if protocol_name not in ["Main", "RinHoldcurrent"]:
+            if (
+                protocol_name in used_protocols
+                and protocol_name not in self._sscx_main_protocols
+            ):
                 recordings = get_recordings(
                     protocol_name, protocol_definition, prefix, apical_point_isec
                 )
 
-                if "type" in protocol_definition:
-                    # add protocol to protocol dict
-                    self._parse_step_and_ramp(
-                        protocol_definition,
-                        protocol_name,
-                        sscx_protocols,
-                        recordings,
-                        stochkv_det,
+                protocol_type = protocol_definition.get("type")
+                if protocol_type is None:
+                    self.protocols_dict[protocol_name] = read_sweep_protocol(
+                        protocol_name, protocol_definition, recordings
                     )
+                elif protocol_type == "RatSSCxThresholdDetectionProtocol":
                     self._parse_sscx_threshold_detection(
                         protocol_definition, recordings, prefix
                     )
-                    self._parse_vecstim_netstim(
-                        protocol_definition, protocol_name, recordings, syn_locs
-                    )
-
-                else:
-                    stimuli = [
-                        ephys.stimuli.NrnSquarePulse(
-                            step_amplitude=stimulus_definition["amp"],
-                            step_delay=stimulus_definition["delay"],
-                            step_duration=stimulus_definition["duration"],
-                            location=SOMA_LOC,
-                            total_duration=stimulus_definition["totduration"],
-                        )
-                        for stimulus_definition in protocol_definition["stimuli"]
-                    ]
-                    self.protocols_dict[protocol_name] = ephys.protocols.SweepProtocol(
-                        name=protocol_name, stimuli=stimuli, recordings=recordings
+                elif protocol_type in readers:
+                    self.protocols_dict[protocol_name] = readers[protocol_type](
+                        protocol_name=protocol_name,
+                        protocol_definition=protocol_definition,
+                        recordings=recordings,
                     )
 
-        if "Main" in protocol_definitions.keys():
+        if "Main" in protocol_definitions:
             self._parse_sscx_main(protocol_definitions, prefix)
         else:
             check_for_forbidden_protocol(self.protocols_dict)
@@ -343,16 +328,30 @@ class ProtocolParser:
             prefix (str): prefix used in naming responses, features, recordings, etc.
 
         Returns:
-            dict containing the protocols
+            dict containing the protocols.
+            If there is a Main protocol, only the Main protocol and the protocols
+            it is built from or runs are included. The other protocols are not parsed.
         """
         protocol_definitions = self.load_protocol_json(protocols_filepath)
 
+        if "Main" in protocol_definitions:
+            # only build the protocols that are used by the Main protocol
+            used_protocols = get_main_protocol_names(
+                protocol_definitions,
+                self._thalamus_chain_protocols,
+                self._chain_protocol_types,
+            )
+        else:
+            used_protocols = protocol_definitions
+
+        # protocol readers by protocol type. Unknown types are ignored.
+        readers = _get_step_readers(thalamus_protocols, stochkv_det)
+
         for protocol_name, protocol_definition in protocol_definitions.items():
-            if protocol_name not in [
-                "Main",
-                "RinHoldcurrent_dep",
-                "RinHoldcurrent_hyp",
-            ]:
+            if (
+                protocol_name in used_protocols
+                and protocol_name not in self._thalamus_main_protocols
+            ):
                 # By default include somatic recording
                 somav_recording = ephys.recordings.CompRecording(
                     name=f"{prefix}.{protocol_name}.soma.v",
@@ -362,35 +361,23 @@ class ProtocolParser:
 
                 recordings = [somav_recording]
 
-                if "type" in protocol_definition:
-                    # add protocol to protocol dict
-                    self._parse_step_and_ramp(
-                        protocol_definition,
-                        protocol_name,
-                        thalamus_protocols,
-                        recordings,
-                        stochkv_det,
+                protocol_type = protocol_definition.get("type")
+                if protocol_type is None:
+                    self.protocols_dict[protocol_name] = read_sweep_protocol(
+                        protocol_name, protocol_definition, recordings
                     )
+                elif protocol_type == "RatSSCxThresholdDetectionProtocol":
                     self._parse_thalamus_threshold_detection(
-                        protocol_definition, protocol_name, recordings, prefix
+                        protocol_name, protocol_definition, recordings, prefix
                     )
-
-                else:
-                    stimuli = [
-                        ephys.stimuli.NrnSquarePulse(
-                            step_amplitude=stimulus_definition["amp"],
-                            step_delay=stimulus_definition["delay"],
-                            step_duration=stimulus_definition["duration"],
-                            location=SOMA_LOC,
-                            total_duration=stimulus_definition["totduration"],
-                        )
-                        for stimulus_definition in protocol_definition["stimuli"]
-                    ]
-                    self.protocols_dict[protocol_name] = ephys.protocols.SweepProtocol(
-                        name=protocol_name, stimuli=stimuli, recordings=recordings
+                elif protocol_type in readers:
+                    self.protocols_dict[protocol_name] = readers[protocol_type](
+                        protocol_name=protocol_name,
+                        protocol_definition=protocol_definition,
+                        recordings=recordings,
                     )
 
-        if "Main" in protocol_definitions.keys():
+        if "Main" in protocol_definitions:
             self._parse_thalamus_main(protocol_definitions, prefix)
         else:
             check_for_forbidden_protocol(self.protocols_dict)
@@ -398,6 +385,73 @@ class ProtocolParser:
         return self.protocols_dict
 
 
+def _read_holding_stimulus(stimuli_definition):
+    """Read the optional holding stimulus from the stimuli definition.
+
+    Args:
+        stimuli_definition (dict): contains the stimuli configuration data
+
+    Returns:
+        ephys.stimuli.NrnSquarePulse: holding stimulus,
+            or None if there is no "holding" in the definition
+    """
+    holding_definition = stimuli_definition.get("holding")
+    if holding_definition is None:
+        return None
+
+    return ephys.stimuli.NrnSquarePulse(
+        step_amplitude=holding_definition["amp"],
+        step_delay=holding_definition["delay"],
+        step_duration=holding_definition["duration"],
+        location=SOMA_LOC,
+        total_duration=holding_definition["totduration"],
+    )
+
+
+def _read_step_definitions(stimuli_definition):
+    """Return the step definitions as a list.
+
+    Args:
+        stimuli_definition (dict): contains the stimuli configuration data.
+            Its "step" can be a single step definition or a list of them.
+
+    Returns:
+        list of dict: step definitions
+    """
+    step_definitions = stimuli_definition["step"]
+    if isinstance(step_definitions, dict):
+        return [step_definitions]
+    return step_definitions
+
+
+def read_sweep_protocol(protocol_name, protocol_definition, recordings):
+    """Read sweep protocol made of square pulses from definition.
+
+    Args:
+        protocol_name (str): name of the protocol
+        protocol_definition (dict): contains the protocol configuration data
+        recordings (bluepyopt.ephys.recordings.CompRecording):
+            recordings to use with this protocol
+
+    Returns:
+        bluepyopt.ephys.protocols.SweepProtocol: Sweep Protocol
+    """
+    stimuli = [
+        ephys.stimuli.NrnSquarePulse(
+            step_amplitude=stimulus_definition["amp"],
+            step_delay=stimulus_definition["delay"],
+            step_duration=stimulus_definition["duration"],
+            location=SOMA_LOC,
+            total_duration=stimulus_definition["totduration"],
+        )
+        for stimulus_definition in protocol_definition["stimuli"]
+    ]
+
+    return ephys.protocols.SweepProtocol(
+        name=protocol_name, stimuli=stimuli, recordings=recordings
+    )
+
+
 def read_ramp_threshold_protocol(protocol_name, protocol_definition, recordings):
     """Read ramp threshold protocol from definition.
 
@@ -447,7 +501,8 @@ def read_ramp_protocol(protocol_name, protocol_definition, recordings):
     Returns:
         RampProtocol: Ramp Protocol
     """
-    ramp_definition = protocol_definition["stimuli"]["ramp"]
+    stimuli_definition = protocol_definition["stimuli"]
+    ramp_definition = stimuli_definition["ramp"]
     ramp_stimulus = ephys.stimuli.NrnRampPulse(
         ramp_amplitude_start=ramp_definition["ramp_amplitude_start"],
         ramp_amplitude_end=ramp_definition["ramp_amplitude_end"],
@@ -457,17 +512,7 @@ def read_ramp_protocol(protocol_name, protocol_definition, recordings):
         total_duration=ramp_definition["totduration"],
     )
 
-    if "holding" in protocol_definition["stimuli"]:
-        holding_definition = protocol_definition["stimuli"]["holding"]
-        holding_stimulus = ephys.stimuli.NrnSquarePulse(
-            step_amplitude=holding_definition["amp"],
-            step_delay=holding_definition["delay"],
-            step_duration=holding_definition["duration"],
-            location=SOMA_LOC,
-            total_duration=holding_definition["totduration"],
-        )
-    else:
-        holding_stimulus = None
+    holding_stimulus = _read_holding_stimulus(stimuli_definition)
 
     return sscx_protocols.RampProtocol(
         name=protocol_name,
@@ -494,38 +539,26 @@ def read_step_protocol(
     Returns:
         sscx_protocols.StepProtocol or thalamus_protocols.StepProtocolCustom: Step Protocol
     """
-    # pylint: disable=undefined-loop-variable
-    step_definitions = protocol_definition["stimuli"]["step"]
-    if isinstance(step_definitions, dict):
-        step_definitions = [step_definitions]
+    stimuli_definition = protocol_definition["stimuli"]
+    step_definitions = _read_step_definitions(stimuli_definition)
 
-    step_stimuli = []
-    for step_definition in step_definitions:
-        step_stim = ephys.stimuli.NrnSquarePulse(
+    step_stimuli = [
+        ephys.stimuli.NrnSquarePulse(
             step_amplitude=step_definition["amp"],
             step_delay=step_definition["delay"],
             step_duration=step_definition["duration"],
             location=SOMA_LOC,
             total_duration=step_definition["totduration"],
         )
-        step_stimuli.append(step_stim)
-
-    if "holding" in protocol_definition["stimuli"]:
-        holding_definition = protocol_definition["stimuli"]["holding"]
-        holding_stimulus = ephys.stimuli.NrnSquarePulse(
-            step_amplitude=holding_definition["amp"],
-            step_delay=holding_definition["delay"],
-            step_duration=holding_definition["duration"],
-            location=SOMA_LOC,
-            total_duration=holding_definition["totduration"],
-        )
-    else:
-        holding_stimulus = None
+        for step_definition in step_definitions
+    ]
+    # stochkv_det is still read from the last step definition, as before
+    step_definition = step_definitions[-1]
+
+    holding_stimulus = _read_holding_stimulus(stimuli_definition)
 
     if stochkv_det is None:
-        stochkv_det = (
-            step_definition["stochkv_det"] if "stochkv_det" in step_definition else None
-        )
+        stochkv_det = step_definition.get("stochkv_det")
 
     if protocol_module is thalamus_protocols:
         return protocol_module.StepProtocolCustom(
@@ -563,20 +596,20 @@ def read_step_threshold_protocol(
         sscx_protocols.StepThresholdProtocol
          or thalamus_protocols.StepThresholdProtocol: StepProtocol with cell's threshold current
     """
-    # pylint: disable=undefined-loop-variable
-    step_definitions = protocol_definition["stimuli"]["step"]
-    if isinstance(step_definitions, dict):
-        step_definitions = [step_definitions]
+    step_definitions = _read_step_definitions(protocol_definition["stimuli"])
 
-    step_stimuli = []
-    for step_definition in step_definitions:
-        step_stim = ephys.stimuli.NrnSquarePulse(
+    step_stimuli = [
+        ephys.stimuli.NrnSquarePulse(
             step_delay=step_definition["delay"],
             step_duration=step_definition["duration"],
             location=SOMA_LOC,
             total_duration=step_definition["totduration"],
         )
-        step_stimuli.append(step_stim)
+        for step_definition in step_definitions
+    ]
+    # the holding duration, stochkv_det and thresh_perc are still read
+    # from the last step definition, as before
+    step_definition = step_definitions[-1]
 
     holding_stimulus = ephys.stimuli.NrnSquarePulse(
         step_delay=0.0,
@@ -586,9 +619,7 @@ def read_step_threshold_protocol(
     )
 
     if stochkv_det is None:
-        stochkv_det = (
-            step_definition["stochkv_det"] if "stochkv_det" in step_definition else None
-        )
+        stochkv_det = step_definition.get("stochkv_det")
 
     if protocol_module is thalamus_protocols:
         return protocol_module.StepThresholdProtocol(
@@ -628,22 +659,21 @@ def read_vecstim_protocol(protocol_name, protocol_definition, recordings, syn_lo
             a protocol containing Vecstim stimulus activating synapses
     """
     stim_definition = protocol_definition["stimuli"]
-    if stim_definition["vecstim_random"] not in [
-        "python",
-        "neuron",
-    ]:
+    vecstim_random = stim_definition["vecstim_random"]
+    if vecstim_random not in _vecstim_random_options:
         logger.warning(
-            "vecstim random not set to 'python' nor to 'neuron' in config file."
-            "vecstim random will be re-set to 'python'."
+            "vecstim random set to %r instead of 'python' or 'neuron' in config file. "
+            "vecstim random will be re-set to 'python'.",
+            vecstim_random,
         )
-        stim_definition["vecstim_random"] = "python"
+        vecstim_random = "python"
 
     stim = NrnVecStimStimulusCustom(
         syn_locs,
         stim_definition["syn_start"],
         stim_definition["syn_stop"],
         stim_definition["syn_stim_seed"],
-        stim_definition["vecstim_random"],
+        vecstim_random,
     )
 
     return sscx_protocols.SweepProtocolCustom(protocol_name, [stim], recordings)
@@ -401,9 +401,11 @@ class RatSSCxRinHoldcurrentProtocol(ephys.protocols.Protocol):
         """
         holdi_estimate = float(holding_voltage - rmp) / rin_noholding
 
-        upper_bound = 0.0
-        lower_bound = self.holdi_estimate_multiplier * holdi_estimate
-        middle_bound = upper_bound - abs(upper_bound - lower_bound) / 2
+        # the bisection expects lower_bound to be the smaller current
+        lower_bound, upper_bound = sorted(
+            (self.holdi_estimate_multiplier * holdi_estimate, 0.0)
+        )
+        middle_bound = (upper_bound + lower_bound) / 2
         middle_voltage = self.voltage_base(
             middle_bound, cell_model, param_values, sim=sim
         )
@@ -417,7 +419,7 @@ class RatSSCxRinHoldcurrentProtocol(ephys.protocols.Protocol):
                 upper_bound = middle_bound
             else:
                 lower_bound = middle_bound
-            middle_bound = upper_bound - abs(upper_bound - lower_bound) / 2
+            middle_bound = (upper_bound + lower_bound) / 2
             middle_voltage = self.voltage_base(
                 middle_bound, cell_model, param_values, sim=sim
             )
@@ -698,6 +700,8 @@ class RatSSCxThresholdDetectionProtocol(ephys.protocols.Protocol):
             float: threshold current amplitude (nA)
         """
         # pylint: disable=undefined-loop-variable, too-many-arguments, too-many-positional-arguments
+        # the scan and the bisection expect lower_bound to be the smaller current
+        lower_bound, upper_bound = sorted((lower_bound, upper_bound))
         step_currents = np.linspace(lower_bound, upper_bound, num=self.short_steps)
 
         if len(step_currents) == 0:
@@ -736,7 +740,7 @@ class RatSSCxThresholdDetectionProtocol(ephys.protocols.Protocol):
 
         depth = 0
         while depth < max_depth and abs(upper_bound - lower_bound) >= precision:
-            middle_bound = upper_bound - abs(upper_bound - lower_bound) / 2
+            middle_bound = (upper_bound + lower_bound) / 2
             spike_detected = self.detect_spike(
                 cell_model,
                 param_values,
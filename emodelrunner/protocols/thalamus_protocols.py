@@ -402,13 +402,18 @@ class RatSSCxRinHoldcurrentProtocol(ephys.protocols.Protocol):
             rin_noholding,
         )
 
+        # the bisection expects lower_bound to be the smaller current
+        lower_bound, upper_bound = sorted(
+            (self.holdi_estimate_multiplier * holdi_estimate, 0.22)
+        )
+
         return self.binsearch_holdi(
             holding_voltage,
             cell_model,
             param_values,
             sim,
-            upper_bound=0.22,
-            lower_bound=self.holdi_estimate_multiplier * holdi_estimate,
+            upper_bound=upper_bound,
+            lower_bound=lower_bound,
             precision=self.holdi_precision,
             max_depth=self.holdi_max_depth,
         )
@@ -427,7 +432,7 @@ class RatSSCxRinHoldcurrentProtocol(ephys.protocols.Protocol):
     ):
         """Do binary search to find holding current."""
         # pylint: disable=too-many-arguments, too-many-positional-arguments
-        middle_bound = upper_bound - abs(upper_bound - lower_bound) / 2
+        middle_bound = (upper_bound + lower_bound) / 2
 
         if depth > max_depth:
             logger.info(
@@ -742,7 +747,7 @@ class RatSSCxThresholdDetectionProtocol(ephys.protocols.Protocol):
         # pylint: disable=too-many-arguments, too-many-positional-arguments
         if depth > max_depth or abs(upper_bound - lower_bound) < precision:
             return upper_bound
-        middle_bound = upper_bound - abs(upper_bound - lower_bound) / 2
+        middle_bound = (upper_bound + lower_bound) / 2
         spike_detected = self.detect_spike(
             cell_model,
             param_values,
@@ -782,6 +787,8 @@ class RatSSCxThresholdDetectionProtocol(ephys.protocols.Protocol):
         upper_bound=None,
     ):
         """Find the current step spiking threshold."""
+        # the scan and the bisection expect lower_bound to be the smaller current
+        lower_bound, upper_bound = sorted((lower_bound, upper_bound))
         step_currents = np.linspace(lower_bound, upper_bound, num=self.short_steps)
 
         if len(step_currents) == 0:
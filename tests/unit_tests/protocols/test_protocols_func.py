@@ -0,0 +1,132 @@
+"""Unit tests for the protocols.protocols_func module."""
+
+# Copyright 2020-2022 Blue Brain Project / EPFL
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from types import SimpleNamespace
+
+from pytest import raises
+
+from bluepyopt import ephys
+
+from emodelrunner.locations import SOMA_LOC
+from emodelrunner.protocols import sscx_protocols
+from emodelrunner.protocols.protocols_func import (
+    check_for_forbidden_protocol,
+    CurrentOutputKeyMixin,
+    get_extra_recording_location,
+    get_recordings,
+)
+
+
+def test_get_extra_recording_location():
+    """Test get_extra_recording_location for each recording type."""
+    location = get_extra_recording_location(
+        {
+            "type": "somadistance",
+            "name": "dend1",
+            "somadistance": 100,
+            "seclist_name": "basal",
+        }
+    )
+    assert isinstance(location, ephys.locations.NrnSomaDistanceCompLocation)
+    assert location.name == "dend1"
+    assert location.soma_distance == 100
+    assert location.seclist_name == "basal"
+
+    recording_definition = {
+        "type": "somadistanceapic",
+        "name": "ca_prox_apic",
+        "somadistance": 50,
+        "seclist_name": "apical",
+    }
+    location = get_extra_recording_location(recording_definition, 22)
+    assert isinstance(location, ephys.locations.NrnSecSomaDistanceCompLocation)
+    assert location.seclist_name == "apic"
+    assert location.sec_index == 22
+    with raises(ValueError):
+        get_extra_recording_location(recording_definition)
+    with raises(ValueError):
+        get_extra_recording_location(
+            dict(recording_definition, seclist_name="unknown"), 22
+        )
+
+    location = get_extra_recording_location(
+        {
+            "type": "nrnseclistcomp",
+            "name": "ca_ais",
+            "comp_x": 0.5,
+            "sec_index": 0,
+            "seclist_name": "axonal",
+        }
+    )
+    assert isinstance(location, ephys.locations.NrnSeclistCompLocation)
+    assert location.comp_x == 0.5
+    assert location.sec_index == 0
+
+    with raises(ValueError):
+        get_extra_recording_location({"type": "unknown"})
+
+
+def test_check_for_forbidden_protocol():
+    """Test that protocols only usable with MainProtocol are detected."""
+    step_protocol = sscx_protocols.StepProtocol("Step", step_stimuli=[])
+    check_for_forbidden_protocol({"Step": step_protocol})
+
+    threshold_protocol = sscx_protocols.StepThresholdProtocol(
+        "StepThreshold", thresh_perc=100, step_stimuli=[]
+    )
+    with raises(ValueError):
+        check_for_forbidden_protocol(
+            {"Step": step_protocol, "StepThreshold": threshold_protocol}
+        )
+
+
+def test_get_recordings():
+    """Test the names and locations of the recordings of a protocol."""
+    protocol_definition = {
+        "extra_recordings": [
+            {
+                "var": "cai",
+                "type": "nrnseclistcomp",
+                "name": "ca_soma",
+                "comp_x": 0.5,
+                "sec_index": 0,
+                "seclist_name": "somatic",
+            }
+        ]
+    }
+
+    recordings = get_recordings("bAP", protocol_definition, "mtype")
+
+    assert [recording.name for recording in recordings] == [
+        "mtype.bAP.soma.v",
+        "mtype.bAP.ca_soma.cai",
+    ]
+    assert [recording.variable for recording in recordings] == ["v", "cai"]
+    assert recordings[0].location is SOMA_LOC
+
+
+def test_curr_output_key():
+    """Test that the current output key is built from the first recording name."""
+    protocol = CurrentOutputKeyMixin()
+
+    protocol.recordings = [SimpleNamespace(name="mtype.Step_150.soma.v")]
+    assert protocol.curr_output_key() == "current_mtype.Step_150"
+
+    protocol.recordings = [SimpleNamespace(name=".Step_150.soma.v")]
+    assert protocol.curr_output_key() == "current_.Step_150"
+
+    protocol.recordings = None
+    assert protocol.curr_output_key() == "current_"
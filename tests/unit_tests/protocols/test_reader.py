@@ -14,6 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
 from pathlib import Path
 from pytest import raises
 
@@ -30,6 +31,7 @@ from emodelrunner.protocols.reader import read_ramp_protocol
 from emodelrunner.protocols.reader import read_ramp_threshold_protocol
 from emodelrunner.protocols.reader import read_step_protocol
 from emodelrunner.protocols.reader import read_step_threshold_protocol
+from emodelrunner.protocols.reader import read_sweep_protocol
 from emodelrunner.protocols.reader import read_vecstim_protocol
 from emodelrunner.recordings import RecordingCustom
 from emodelrunner.synapses.create_locations import get_syn_locs
@@ -84,6 +86,45 @@ class TestProtocolParser:
             assert set(protocols_dict.keys()) == sscx_recipe_protocol_keys
             assert all(x is not None for x in protocols_dict)
 
+    def test_load_protocol_json(self, tmp_path):
+        """Test that the comment keys are dropped from the protocol definitions."""
+        protocols_filepath = tmp_path / "protocols.json"
+        protocols_filepath.write_text(
+            '{"__comment": "test", "__note": "test", "RMP": {}}', encoding="utf-8"
+        )
+
+        protocol_definitions = ProtocolParser.load_protocol_json(protocols_filepath)
+        assert protocol_definitions == {"RMP": {}}
+
+        # modifying the returned definitions does not alter later loads
+        protocol_definitions["Rin"] = {}
+        protocol_definitions["RMP"]["type"] = "StepProtocol"
+        assert ProtocolParser.load_protocol_json(protocols_filepath) == {"RMP": {}}
+
+    def test_sscx_protocols_parser_skips_unused_protocols(self, tmp_path):
+        """Test that protocols not used by the Main protocol are not parsed."""
+        with cwd(sscx_sample_dir):
+            prot_args = load_config(
+                config_path=Path("config") / "config_recipe_protocols.ini"
+            ).prot_args()
+            protocol_definitions = ProtocolParser.load_protocol_json(
+                prot_args.prot_path
+            )
+
+        protocol_definitions["Unused"] = protocol_definitions["Step_200"]
+        protocols_filepath = tmp_path / "protocols.json"
+        with open(protocols_filepath, "w", encoding="utf-8") as protocol_file:
+            json.dump(protocol_definitions, protocol_file)
+
+        protocols_dict = ProtocolParser().parse_sscx_protocols(
+            protocols_filepath=protocols_filepath,
+            prefix=prot_args.mtype,
+            apical_point_isec=prot_args.apical_point_isec,
+        )
+
+        assert "Unused" not in protocols_dict
+        assert set(protocols_dict.keys()) == sscx_recipe_protocol_keys
+
     def test_thalamus_protocols_parser(self):
         """Test to assure all thalamus protocols are parsed."""
         with cwd(thalamus_sample_dir):
@@ -101,6 +142,27 @@ class TestProtocolParser:
             assert all(x is not None for x in protocols_dict)
 
 
+def test_read_sweep_protocol():
+    """Test read_sweep_protocol."""
+    protocol_definition = {
+        "stimuli": [
+            {"delay": 70.0, "amp": 0.1, "duration": 200.0, "totduration": 300.0},
+            {"delay": 0.0, "amp": -0.05, "duration": 300.0, "totduration": 300.0},
+        ],
+    }
+    prot = read_sweep_protocol("Sweep", protocol_definition, recordings)
+    assert isinstance(prot, ephys.protocols.SweepProtocol)
+    assert prot.name == "Sweep"
+    assert prot.recordings == recordings
+    assert len(prot.stimuli) == 2
+    assert all(isinstance(stim, ephys.stimuli.NrnSquarePulse) for stim in prot.stimuli)
+    assert prot.stimuli[0].step_amplitude == 0.1
+    assert prot.stimuli[0].step_delay == 70.0
+    assert prot.stimuli[1].step_amplitude == -0.05
+    assert prot.stimuli[1].location == SOMA_LOC
+    assert prot.stimuli[1].total_duration == 300.0
+
+
 def test_read_ramp_threshold_protocol():
     """Test read_ramp_threshold_protocol."""
     protocol_definition = {
@@ -356,6 +418,7 @@ def test_read_vecstim_protocol():
     protocol_definition["stimuli"]["vecstim_random"] = "unknown"
     prot = read_vecstim_protocol("Vecstim", protocol_definition, recordings, syn_locs)
     assert prot.stimuli[0].vecstim_random == "python"
+    assert protocol_definition["stimuli"]["vecstim_random"] == "unknown"
 
     # stop is None case
     protocol_definition["stimuli"]["syn_stop"] = None
@@ -0,0 +1,85 @@
+"""Unit tests for the protocols.thalamus_protocols module."""
+
+# Copyright 2020-2022 Blue Brain Project / EPFL
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from emodelrunner.protocols.thalamus_protocols import (
+    RatSSCxRinHoldcurrentProtocol,
+    RatSSCxThresholdDetectionProtocol,
+)
+
+RMP = -80.0
+RIN = 100.0
+THRESHOLD = 0.3
+
+
+def linear_voltage_base(current, cell_model, param_values, sim=None):
+    """Holding voltage (mV) of a passive cell with RMP and RIN."""
+    # pylint: disable=unused-argument
+    return RMP + RIN * current
+
+
+def detect_spike_above_threshold(
+    cell_model, param_values, sim=None, step_current=None, holdi=None, short=False
+):
+    """Spike whenever the step current reaches THRESHOLD (nA)."""
+    # pylint: disable=unused-argument, too-many-arguments
+    return step_current >= THRESHOLD
+
+
+def search_holdi(holding_voltage):
+    """Search the holding current with a stubbed voltage_base."""
+    protocol = RatSSCxRinHoldcurrentProtocol(
+        "RinHoldcurrent_dep", holdi_precision=0.01, holdi_max_depth=20
+    )
+    protocol.voltage_base = linear_voltage_base
+    return protocol.search_holdi(None, {}, None, holding_voltage, RIN, RMP)
+
+
+def test_search_holdi():
+    """Test search_holdi with 2 * estimate below and above the 0.22 nA bound."""
+    # 2 * estimate (-0.2 nA) is below 0.22 nA: bounds already in order
+    holdi = search_holdi(holding_voltage=-90.0)
+    assert abs(linear_voltage_base(holdi, None, {}) + 90.0) < 0.01
+    assert abs(holdi + 0.1) < 1e-4
+
+    # 2 * estimate (0.5 nA) is above 0.22 nA and becomes the upper bound
+    holdi = search_holdi(holding_voltage=-55.0)
+    assert abs(linear_voltage_base(holdi, None, {}) + 55.0) < 0.01
+    assert abs(holdi - 0.25) < 1e-4
+
+
+def test_search_spike_threshold():
+    """Test that search_spike_threshold does not depend on the bounds order."""
+    protocol = RatSSCxThresholdDetectionProtocol("ThresholdDetection_dep")
+    protocol.detect_spike = detect_spike_above_threshold
+
+    ordered = protocol.search_spike_threshold(
+        None, {}, holdi=0.0, lower_bound=0.0, upper_bound=1.0
+    )
+    # 5 bisection steps between 0 nA and the first spiking scan current (0.5 nA)
+    assert THRESHOLD <= ordered < THRESHOLD + 0.5 / 2**5
+
+    reversed_ = protocol.search_spike_threshold(
+        None, {}, holdi=0.0, lower_bound=1.0, upper_bound=0.0
+    )
+    assert reversed_ == ordered
+
+    # no spike within the bounds
+    assert (
+        protocol.search_spike_threshold(
+            None, {}, holdi=0.0, lower_bound=0.0, upper_bound=0.2
+        )
+        is None
+    )
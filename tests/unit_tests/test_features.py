@@ -0,0 +1,67 @@
+"""Unit tests for features.py."""
+
+# Copyright 2020-2022 Blue Brain Project / EPFL
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pathlib import Path
+
+from emodelrunner.features import (
+    define_efeatures,
+    LazyEFeatures,
+    load_feature_definitions,
+)
+from emodelrunner.load import load_config
+from emodelrunner.protocols.reader import ProtocolParser
+
+from tests.utils import cwd
+
+sscx_sample_dir = Path("examples") / "sscx_sample_dir"
+
+
+def test_lazy_efeatures():
+    """Test that LazyEFeatures matches define_efeatures and builds on demand."""
+    with cwd(sscx_sample_dir):
+        config = load_config(config_path=Path("config") / "config_recipe_protocols.ini")
+        prot_args = config.prot_args()
+        protocols_dict = ProtocolParser().parse_sscx_protocols(
+            protocols_filepath=prot_args.prot_path,
+            prefix=prot_args.mtype,
+            apical_point_isec=prot_args.apical_point_isec,
+        )
+
+        efeatures = define_efeatures(
+            protocols_dict["Main"], prot_args.features_path, prot_args.mtype
+        )
+        lazy_efeatures = LazyEFeatures(
+            protocols_dict["Main"], prot_args.features_path, prot_args.mtype
+        )
+
+        key = f"{prot_args.mtype}.RMP.soma.v.voltage_base"
+        assert lazy_efeatures._efeatures == {}
+        assert lazy_efeatures[key].name == efeatures[key].name
+        assert lazy_efeatures[key].exp_mean == efeatures[key].exp_mean
+        assert lazy_efeatures[key] is lazy_efeatures[key]
+        assert list(lazy_efeatures._efeatures) == [key]
+        assert set(lazy_efeatures) == set(efeatures)
+        assert len(lazy_efeatures) == len(efeatures)
+
+
+def test_load_feature_definitions(tmp_path):
+    """Test that the comment keys are dropped from the feature definitions."""
+    features_path = tmp_path / "features.json"
+    features_path.write_text(
+        '{"__comment": "test", "RMP": {"soma.v": []}}', encoding="utf-8"
+    )
+
+    assert load_feature_definitions(features_path) == {"RMP": {"soma.v": []}}